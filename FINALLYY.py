@@ -398,20 +398,19 @@ class CategoryBox(tk.Frame):
         self.add_btn = tk.Button(self, text=f"Add expense to {category_name}", wraplength=self.BOX_WIDTH-10, justify="center", command=self.add_expense)
         self.del_btn = tk.Button(self, text=f"Delete {category_name}", wraplength=self.BOX_WIDTH-10, justify="center", command=self.delete_category)
 
-        self.bind_recursive(self, "<Enter>", self.on_hover)
-        self.bind_recursive(self, "<Leave>", self.on_leave)
-
-    def bind_recursive(self, widget, event, func):
-        widget.bind(event, func)
-        for child in widget.winfo_children():
-            self.bind_recursive(child, event, func)
+        # Hover is driven by CategoryScreen's dispatcher, not per-widget bindings
+        self.hovered = False
 
     def on_hover(self, event=None):
+        if self.hovered: return
+        self.hovered = True
         self.content_frame.place_forget()
         self.add_btn.place(relx=0.5, rely=0.35, anchor="center")
         self.del_btn.place(relx=0.5, rely=0.65, anchor="center")
 
     def on_leave(self, event=None):
+        if not self.hovered: return
+        self.hovered = False
         self.add_btn.place_forget()
         self.del_btn.place_forget()
         self.content_frame.place(relx=0.5, rely=0.5, anchor="center")
@@ -439,7 +438,8 @@ class CategoryBox(tk.Frame):
 
         req_height = max(self.BOX_HEIGHT, self.content_frame.winfo_reqheight() + 2*self.BOX_PADDING)
         self.config(height=req_height)
-        self.content_frame.place(relx=0.5, rely=0.5, anchor="center")
+        if not self.hovered:
+            self.content_frame.place(relx=0.5, rely=0.5, anchor="center")
 
     def delete_category(self):
         self.remove_callback(self)
@@ -453,8 +453,16 @@ class CategoryScreen(ScreenBase):
         super().__init__(master, app, bg="#f8f0ff")
         self.category_boxes = []
         self.max_cols = 4
+        self.hovered_box = None
+        self.pointer = None
+        self.hover_pending = False
         self.build()
 
+        # One delegated dispatcher for every box, including widgets added later
+        self.bind_all("<Motion>", self.on_pointer, add="+")
+        self.bind_all("<Enter>", self.on_pointer, add="+")
+        self.bind_all("<Leave>", self.on_pointer, add="+")
+
     def build(self):
         self.add_btn = ttk.Button(self, text="Add Category", command=self.add_category)
         self.add_btn.grid(row=0, column=0, pady=20)
@@ -469,6 +477,32 @@ class CategoryScreen(ScreenBase):
         back.grid(row=0, column=0, padx=10)
         cont.grid(row=0, column=1, padx=10)
 
+    def on_pointer(self, event):
+        """Records the pointer and hit-tests once per idle, no matter how many events fired."""
+        self.pointer = (event.x_root, event.y_root)
+        if not self.hover_pending:
+            self.hover_pending = True
+            self.after_idle(self.update_hover)
+
+    def update_hover(self):
+        self.hover_pending = False
+        box = self.box_at(*self.pointer) if self.winfo_ismapped() else None
+        if box is self.hovered_box: return
+        if self.hovered_box: self.hovered_box.on_leave()
+        self.hovered_box = box
+        if box: box.on_hover()
+
+    def box_at(self, x, y):
+        try:
+            widget = self.winfo_containing(x, y)
+        except (KeyError, tk.TclError):
+            return None
+        while widget is not None and widget is not self.box_frame:
+            if isinstance(widget, CategoryBox):
+                return widget
+            widget = widget.master
+        return None
+
     def add_category(self):
         name = simpledialog.askstring("New Category", "Enter your new category's name:", parent=self)
         if not name: return
@@ -477,6 +511,7 @@ class CategoryScreen(ScreenBase):
         self.reposition_boxes()
 
     def remove_category(self, box):
+        if box is self.hovered_box: self.hovered_box = None
         box.destroy()
         self.category_boxes.remove(box)
         self.reposition_boxes()
@@ -0,0 +1,287 @@
+"""
+Diff and three-way merge for BudgetBuddy save files.
+
+    python -m library.budgetdiff diff old.txt new.txt [--income 2000]
+    python -m library.budgetdiff merge base.txt ours.txt theirs.txt -o merged.txt
+
+Expenses are grouped by category and name in dicts. Repeats of one name are
+matched by amount first and by position after that, so every comparison stays
+linear and deleting one of two same-named expenses is not read as an edit.
+"""
+import argparse
+import sys
+from collections import Counter, deque
+
+from library import functions
+from library import savefile
+from library.classes import Budget
+
+
+def iter_categories(path):
+    """
+    Streams a save file one category at a time.
+    Yields (category, {name: [amounts]}) with names in file order.
+    """
+    category = None
+    names = {}
+    for cat, name, amount in savefile.iter_save_file(path):
+        if name is None:
+            if category is not None:
+                yield category, names
+            category, names = cat, {}
+        else:
+            names.setdefault(name, []).append(round(amount, 2))
+    if category is not None:
+        yield category, names
+
+
+def read_categories(path):
+    """Loads a whole save file as {category: {name: [amounts]}}."""
+    categories = {}
+    for category, names in iter_categories(path):
+        merged = categories.setdefault(category, {})
+        for name, amounts in names.items():
+            merged.setdefault(name, []).extend(amounts)
+    return categories
+
+
+def match_amounts(before, after):
+    """
+    Pairs up the amounts of one expense name in two versions of a file.
+    Equal amounts are matched first, whatever is left pairs up by position.
+    Returns (i, j) index pairs; i is None for an added entry, j for a removed one.
+    """
+    free = {}
+    for i, amount in enumerate(before):
+        free.setdefault(amount, deque()).append(i)
+
+    pairs = []
+    left_after = []
+    for j, amount in enumerate(after):
+        if free.get(amount):
+            pairs.append((free[amount].popleft(), j))
+        else:
+            left_after.append(j)
+
+    matched = [False] * len(before)
+    for i, _ in pairs:
+        matched[i] = True
+    left_before = [i for i in range(len(before)) if not matched[i]]
+    for k in range(max(len(left_before), len(left_after))):
+        pairs.append((left_before[k] if k < len(left_before) else None,
+                      left_after[k] if k < len(left_after) else None))
+    return pairs
+
+
+def diff_files(old_path, new_path, income=None):
+    """
+    Compares two save files. Only the old file is held in memory; the new one is
+    streamed against it a category at a time. Returns a dict with the added,
+    removed and changed entries plus totals. Balances from calc_balance are
+    included only when an income is given, since the save files do not store one.
+    """
+    old = read_categories(old_path)
+    old_total = sum(sum(amounts) for names in old.values() for amounts in names.values())
+
+    report = {"categories_added": [], "categories_removed": [],
+              "added": [], "removed": [], "changed": []}
+    new_total = 0
+    seen = set()
+    for category, names in iter_categories(new_path):
+        if category not in old and category not in seen:
+            report["categories_added"].append(category)
+        seen.add(category)
+        old_names = old.pop(category, {})
+        for name, after in names.items():
+            new_total += sum(after)
+            before = old_names.pop(name, [])
+            for i, j in match_amounts(before, after):
+                if i is None:
+                    report["added"].append((category, name, after[j]))
+                elif j is None:
+                    report["removed"].append((category, name, before[i]))
+                elif before[i] != after[j]:
+                    report["changed"].append((category, name, before[i], after[j]))
+        for name, before in old_names.items():
+            for amount in before:
+                report["removed"].append((category, name, amount))
+
+    for category, names in old.items():
+        report["categories_removed"].append(category)
+        for name, before in names.items():
+            for amount in before:
+                report["removed"].append((category, name, amount))
+
+    report.update({
+        "income": income,
+        "old_total": old_total, "new_total": new_total,
+        "total_delta": new_total - old_total,
+    })
+    if income is not None:
+        old_balance, _ = functions.balance_report(income, old_total)
+        new_balance, status = functions.balance_report(income, new_total)
+        report.update({
+            "old_balance": old_balance, "new_balance": new_balance,
+            "balance_delta": new_balance - old_balance,
+            "status": status,
+        })
+    return report
+
+
+def format_diff(report):
+    lines = []
+    for category in report["categories_added"]:
+        lines.append(f"+ [{category}]")
+    for category in report["categories_removed"]:
+        lines.append(f"- [{category}]")
+    for category, name, amount in report["added"]:
+        lines.append(f"+ {category} / {name} : ${amount:.2f}")
+    for category, name, amount in report["removed"]:
+        lines.append(f"- {category} / {name} : ${amount:.2f}")
+    for category, name, before, after in report["changed"]:
+        lines.append(f"~ {category} / {name} : ${before:.2f} -> ${after:.2f} ({after - before:+.2f})")
+    if not lines:
+        lines.append("No differences.")
+    lines.append("")
+    lines.append(f"Total Expenses: ${report['old_total']:.2f} -> ${report['new_total']:.2f} "
+                 f"({report['total_delta']:+.2f})")
+    if report["income"] is not None:
+        lines.append(f"Remaining Balance: ${report['old_balance']:.2f} -> ${report['new_balance']:.2f} "
+                     f"({report['balance_delta']:+.2f})")
+        lines.append(report["status"])
+    return "\n".join(lines)
+
+
+def pick(base, ours, theirs):
+    """Three-way choice for one entry. None means absent. Returns (value, conflict)."""
+    if ours == theirs or theirs == base:
+        return ours, False
+    if ours == base:
+        return theirs, False
+    return ours, True
+
+
+def side_changes(base, side):
+    """
+    Lines one version's amounts for an expense name up with the base amounts.
+    Returns (per base entry: its amount in this version or None, added amounts).
+    """
+    current = [None] * len(base)
+    added = []
+    for i, j in match_amounts(base, side):
+        if i is None:
+            added.append(side[j])
+        elif j is not None:
+            current[i] = side[j]
+    return current, added
+
+
+def merge_files(base_path, ours_path, theirs_path, out_path=None):
+    """
+    Three-way merges two edited copies of the same budget. Changes made on only
+    one side are taken; when both sides changed an entry differently, ours is
+    kept and the entry is reported as a conflict. Deleting a category on one
+    side while the other side added or changed expenses in it is a conflict too.
+    Returns (budgets, conflicts) and writes the result if out_path is given.
+    """
+    base = read_categories(base_path)
+    ours = read_categories(ours_path)
+    theirs = read_categories(theirs_path)
+
+    conflicts = []
+    budgets = []
+    for category in {**ours, **theirs, **base}:
+        b_names = base.get(category, {})
+        o_names = ours.get(category, {})
+        t_names = theirs.get(category, {})
+        headers = tuple(True if category in side else None for side in (base, ours, theirs))
+        keep, _ = pick(*headers)
+
+        budget = Budget(category)
+        for name in {**o_names, **t_names, **b_names}:
+            before = b_names.get(name, [])
+            o_current, o_added = side_changes(before, o_names.get(name, []))
+            t_current, t_added = side_changes(before, t_names.get(name, []))
+
+            for amount, o, t in zip(before, o_current, t_current):
+                merged, conflict = pick(amount, o, t)
+                if conflict:
+                    conflicts.append((category, name, amount, o, t))
+                if merged is not None:
+                    budget.categories.append(name)
+                    budget.expenses.append(merged)
+
+            # Both sides adding the same amount counts as one addition
+            new = list(o_added)
+            unmatched = Counter(o_added)
+            for amount in t_added:
+                if unmatched[amount]:
+                    unmatched[amount] -= 1
+                else:
+                    new.append(amount)
+            budget.categories.extend([name] * len(new))
+            budget.expenses.extend(new)
+
+        if not keep and budget.expenses:
+            # The category was deleted on one side while the other side added
+            # or changed expenses in it. Report it and follow ours.
+            conflicts.append((category, None) + headers)
+            keep = headers[1]
+        if keep:
+            budgets.append(budget)
+
+    if out_path:
+        savefile.write_budgets(out_path, budgets)
+    return budgets, conflicts
+
+
+def format_conflicts(conflicts):
+    def show(value):
+        if value is None: return "(absent)"
+        if value is True: return "(present)"
+        return f"${value:.2f}"
+
+    lines = []
+    for category, name, base, ours, theirs in conflicts:
+        label = f"[{category}]" if name is None else f"{category} / {name}"
+        lines.append(f"! {label}: base {show(base)}, ours {show(ours)}, theirs {show(theirs)}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Diff and merge BudgetBuddy save files")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_diff = sub.add_parser("diff", help="compare two save files")
+    p_diff.add_argument("old")
+    p_diff.add_argument("new")
+    p_diff.add_argument("--income", type=float, default=None,
+                        help="monthly income; balance lines are shown only when given")
+
+    p_merge = sub.add_parser("merge", help="three-way merge two edits of the same save file")
+    p_merge.add_argument("base")
+    p_merge.add_argument("ours")
+    p_merge.add_argument("theirs")
+    p_merge.add_argument("-o", "--output", help="file to write (default: print to stdout)")
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "diff":
+            print(format_diff(diff_files(args.old, args.new, args.income)))
+            return 0
+
+        budgets, conflicts = merge_files(args.base, args.ours, args.theirs, args.output)
+        if not args.output:
+            print(savefile.format_budgets(budgets))
+        if conflicts:
+            print(f"{len(conflicts)} conflict(s), kept ours:", file=sys.stderr)
+            print(format_conflicts(conflicts), file=sys.stderr)
+            return 1
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"** ERROR ** {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,6 @@
+import contextlib
+import io
+
 #logic from project 4
 def calc_balance(income, expenses):
     print(f"Total expenses are {expenses}")
@@ -10,4 +13,13 @@ def financial_status(balance):
     elif balance == 0:
         print("You are breaking even.")
     else:
-        print("**WARNING** You are overspending!")
\ No newline at end of file
+        print("**WARNING** You are overspending!")
+
+def balance_report(income, expenses):
+    """Runs calc_balance and financial_status quietly, returning (balance, status message)."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        balance = calc_balance(income, expenses)
+        financial_status(balance)
+    status = out.getvalue().strip().splitlines()[-1]
+    return balance, status
@@ -0,0 +1,113 @@
+import math
+import os
+import re
+from library.classes import Budget
+
+# Same rule DatafileScreen uses for save file names
+NAME_PATTERN = r"[A-Za-z0-9_]+"
+
+
+def save_path(directory, name):
+    """Returns the .txt path for a save file name, or raises ValueError."""
+    if not re.fullmatch(NAME_PATTERN, name):
+        raise ValueError("Letters, numbers, underscores only.")
+    return os.path.join(directory, name + ".txt")
+
+
+def parse_expense(line):
+    """Splits a "Name : $12.50" line into (name, amount), or returns None."""
+    name, sep, amount = line.rpartition(" : $")
+    if not sep:
+        return None
+    try:
+        amount = float(amount)
+    except ValueError:
+        return None
+    if not math.isfinite(amount):
+        return None
+    return name, amount
+
+
+def iter_save_file(path):
+    """
+    Streams a save file one line at a time.
+    Yields (category, None, None) for each category header and
+    (category, name, amount) for each expense under it.
+    """
+    category = None
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip():
+                category = None
+                continue
+            if category is None:
+                category = line
+                yield category, None, None
+                continue
+            parsed = parse_expense(line)
+            if parsed is None:
+                raise ValueError(f"Bad expense line in {path}: {line!r}")
+            yield category, parsed[0], parsed[1]
+
+
+def iter_expenses(path):
+    """Streams only the (category, name, amount) expense entries of a save file."""
+    for category, name, amount in iter_save_file(path):
+        if name is not None:
+            yield category, name, amount
+
+
+def read_budgets(path):
+    """Loads a save file into a list of Budget objects, one per category."""
+    budgets = []
+    for category, name, amount in iter_save_file(path):
+        if name is None:
+            budgets.append(Budget(category))
+        else:
+            budgets[-1].categories.append(name)
+            budgets[-1].expenses.append(amount)
+    return budgets
+
+
+def check_name(name, what):
+    """Names are single lines in the save file, so they must be non-blank and newline free."""
+    if not name.strip():
+        raise ValueError(f"{what} name cannot be empty.")
+    if "\n" in name or "\r" in name:
+        raise ValueError(f"{what} name cannot contain line breaks.")
+
+
+def validate_budgets(budgets):
+    """Raises ValueError for anything that would not read back from the save file."""
+    for budget in budgets:
+        check_name(budget.expense_type, "Category")
+        for name, total in zip(budget.categories, budget.expenses):
+            check_name(name, "Expense")
+            if not math.isfinite(total):
+                raise ValueError(f"Amount for {name!r} must be a finite number.")
+
+
+def stored_amount(amount):
+    """The value a later read returns for an amount, since files keep two decimals."""
+    return float(f"{amount:.2f}")
+
+
+def format_budgets(budgets):
+    """Builds the save file text, matching SummaryScreen.save_to_file."""
+    validate_budgets(budgets)
+    lines = []
+    for budget in budgets:
+        lines.append(f"{budget.expense_type}")
+        for name, total in zip(budget.categories, budget.expenses):
+            lines.append(f"{name} : ${total:.2f}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def write_budgets(path, budgets):
+    """Writes budgets to a temp file first so readers never see half a file."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(format_budgets(budgets))
+    os.replace(tmp, path)
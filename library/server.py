@@ -0,0 +1,359 @@
+"""
+Local JSON API for BudgetBuddy save files.
+
+Run with:  python -m library.server --dir . --port 8765
+
+Routes
+  GET  /files                      list save file names
+  GET  /files/<name>               categories, expenses and totals
+  PUT  /files/<name>               replace the whole file
+  POST /files/<name>/expenses      add one expense {"category", "name", "amount"}
+  GET  /files/<name>/expenses      stream expenses as newline-delimited JSON
+  GET  /files/<name>/balance?income=N   calc_balance / financial_status result
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import shutil
+import tempfile
+import weakref
+from urllib.parse import urlsplit, parse_qs
+
+from library import functions
+from library.classes import Budget
+from library import savefile
+
+MAX_BODY = 10 * 1024 * 1024
+STREAM_BATCH = 500
+
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large",
+           431: "Request Header Fields Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# -------------------------------------------------------------
+# BUDGET HELPERS
+# -------------------------------------------------------------
+def budgets_to_json(budgets):
+    categories = []
+    for budget in budgets:
+        categories.append({
+            "category": budget.expense_type,
+            "expenses": [{"name": n, "amount": a} for n, a in zip(budget.categories, budget.expenses)],
+            "total": sum(budget.expenses),
+        })
+    return {"categories": categories, "total": sum(c["total"] for c in categories)}
+
+
+def budgets_from_json(data):
+    try:
+        budgets = []
+        for cat in data["categories"]:
+            budget = Budget(str(cat["category"]))
+            for exp in cat.get("expenses", []):
+                budget.categories.append(str(exp["name"]))
+                budget.expenses.append(float(exp["amount"]))
+            budgets.append(budget)
+    except (KeyError, TypeError, ValueError) as e:
+        raise HTTPError(400, f"Invalid budget data: {e}")
+    try:
+        savefile.validate_budgets(budgets)
+    except ValueError as e:
+        raise HTTPError(400, str(e))
+    for budget in budgets:
+        budget.expenses = [savefile.stored_amount(a) for a in budget.expenses]
+    return budgets
+
+
+def add_expense(path, category, name, amount):
+    budgets = savefile.read_budgets(path) if os.path.isfile(path) else []
+    for budget in budgets:
+        if budget.expense_type == category:
+            break
+    else:
+        budget = Budget(category)
+        budgets.append(budget)
+    budget.categories.append(name)
+    budget.expenses.append(amount)
+    savefile.write_budgets(path, budgets)
+
+
+def next_batch(it, size):
+    batch = []
+    for item in it:
+        batch.append(item)
+        if len(batch) >= size:
+            break
+    return batch
+
+
+# -------------------------------------------------------------
+# SERVER
+# -------------------------------------------------------------
+class BudgetServer:
+    def __init__(self, directory=".", host="127.0.0.1", port=8765):
+        self.directory = directory
+        self.host = host
+        self.port = port
+        # Locks disappear once no request holds or waits on them
+        self.locks = weakref.WeakValueDictionary()
+        self.server = None
+
+    def lock_for(self, path):
+        """
+        One lock per save file. Every read and write of the file on disk happens
+        under it, because Windows refuses to os.replace a file someone has open.
+        """
+        path = os.path.abspath(path)
+        lock = self.locks.get(path)
+        if lock is None:
+            lock = self.locks[path] = asyncio.Lock()
+        return lock
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await self.read_request(reader)
+                except HTTPError as e:
+                    # The body was not read, so the connection cannot be reused
+                    await self.send_json(writer, e.status, {"error": e.message})
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    await self.dispatch(method, target, body, writer)
+                except HTTPError as e:
+                    await self.send_json(writer, e.status, {"error": e.message})
+                except Exception as e:
+                    await self.send_json(writer, 500, {"error": str(e)})
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def read_line(self, reader):
+        """readline raises ValueError past the stream limit (64 KiB by default)."""
+        try:
+            return await reader.readline()
+        except ValueError:
+            raise HTTPError(431, "Request line or header too long.")
+
+    async def read_request(self, reader):
+        line = await self.read_line(reader)
+        if not line:
+            return None
+        try:
+            method, target, _ = line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            return None
+
+        headers = {}
+        while True:
+            line = await self.read_line(reader)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", 0) or 0)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length.")
+        if length > MAX_BODY:
+            raise HTTPError(413, "Request body too large.")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target, headers, body
+
+    async def send_json(self, writer, status, data):
+        payload = json.dumps(data).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n\r\n")
+        writer.write(head.encode("latin-1") + payload)
+        await writer.drain()
+
+    async def dispatch(self, method, target, body, writer):
+        url = urlsplit(target)
+        parts = [p for p in url.path.split("/") if p]
+        query = parse_qs(url.query)
+
+        if parts == ["files"]:
+            if method != "GET":
+                raise HTTPError(405, "Use GET.")
+            names = await asyncio.to_thread(self.list_files)
+            return await self.send_json(writer, 200, {"files": names})
+
+        if len(parts) < 2 or parts[0] != "files":
+            raise HTTPError(404, "Unknown route.")
+        try:
+            path = savefile.save_path(self.directory, parts[1])
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        route = (method, tuple(parts[2:]))
+
+        if route == ("GET", ()):
+            budgets = await self.load(path)
+            return await self.send_json(writer, 200, budgets_to_json(budgets))
+        if route == ("PUT", ()):
+            budgets = budgets_from_json(self.parse_body(body))
+            async with self.lock_for(path):
+                await asyncio.to_thread(savefile.write_budgets, path, budgets)
+            return await self.send_json(writer, 200, budgets_to_json(budgets))
+        if route == ("POST", ("expenses",)):
+            data = self.parse_body(body)
+            try:
+                category, name, amount = str(data["category"]), str(data["name"]), float(data["amount"])
+            except (KeyError, TypeError, ValueError) as e:
+                raise HTTPError(400, f"Invalid expense: {e}")
+            expense = Budget(category)
+            expense.categories.append(name)
+            expense.expenses.append(amount)
+            try:
+                savefile.validate_budgets([expense])
+            except ValueError as e:
+                raise HTTPError(400, str(e))
+            amount = savefile.stored_amount(amount)
+            async with self.lock_for(path):
+                try:
+                    await asyncio.to_thread(add_expense, path, category, name, amount)
+                except ValueError as e:
+                    raise HTTPError(400, str(e))
+            return await self.send_json(writer, 201, {"category": category, "name": name, "amount": amount})
+        if route == ("GET", ("expenses",)):
+            return await self.stream_expenses(path, writer)
+        if route == ("GET", ("balance",)):
+            try:
+                income = float(query.get("income", ["0"])[0])
+                if not math.isfinite(income):
+                    raise ValueError
+            except ValueError:
+                raise HTTPError(400, "income must be a number.")
+            budgets = await self.load(path)
+            total = sum(sum(b.expenses) for b in budgets)
+            balance, status = functions.balance_report(income, total)
+            return await self.send_json(writer, 200, {
+                "income": income, "total_expenses": total, "balance": balance, "status": status})
+
+        raise HTTPError(405 if parts[2:] in ([], ["expenses"], ["balance"]) else 404, "Unsupported request.")
+
+    def parse_body(self, body):
+        try:
+            return json.loads(body.decode("utf-8") or "null")
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise HTTPError(400, f"Invalid JSON: {e}")
+
+    def list_files(self):
+        return sorted(f[:-4] for f in os.listdir(self.directory) if f.endswith(".txt"))
+
+    async def load(self, path):
+        try:
+            async with self.lock_for(path):
+                return await asyncio.to_thread(savefile.read_budgets, path)
+        except FileNotFoundError:
+            raise HTTPError(404, "File does not exist.")
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+
+    async def snapshot(self, path):
+        """Copies the save file under its lock so it can be streamed without holding the lock."""
+        fd, copy = tempfile.mkstemp(suffix=".txt")
+        os.close(fd)
+        try:
+            async with self.lock_for(path):
+                await asyncio.to_thread(shutil.copyfile, path, copy)
+        except FileNotFoundError:
+            os.remove(copy)
+            raise HTTPError(404, "File does not exist.")
+        return copy
+
+    async def stream_expenses(self, path, writer):
+        """
+        Sends expenses in chunks so large files never sit in memory all at once.
+        The listing comes from a private snapshot of the file, so a slow client
+        never holds the file's lock and writes go ahead while it is reading.
+        """
+        copy = await self.snapshot(path)
+        it = savefile.iter_expenses(copy)
+        try:
+            # Read the first batch before the headers so a bad file still
+            # gets a normal error response
+            try:
+                batch = await asyncio.to_thread(next_batch, it, STREAM_BATCH)
+            except ValueError as e:
+                raise HTTPError(400, str(e).replace(copy, path))
+            writer.write(b"HTTP/1.1 200 OK\r\n"
+                         b"Content-Type: application/x-ndjson\r\n"
+                         b"Transfer-Encoding: chunked\r\n\r\n")
+            try:
+                while batch:
+                    chunk = "".join(json.dumps({"category": c, "name": n, "amount": a}) + "\n"
+                                    for c, n, a in batch).encode("utf-8")
+                    writer.write(f"{len(chunk):x}\r\n".encode("latin-1") + chunk + b"\r\n")
+                    await writer.drain()
+                    batch = await asyncio.to_thread(next_batch, it, STREAM_BATCH)
+            except ConnectionError:
+                raise
+            except (OSError, ValueError) as e:
+                # Headers are already sent, so report the error as the last line
+                chunk = (json.dumps({"error": str(e).replace(copy, path)}) + "\n").encode("utf-8")
+                writer.write(f"{len(chunk):x}\r\n".encode("latin-1") + chunk + b"\r\n")
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        finally:
+            it.close()
+            os.remove(copy)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BudgetBuddy local JSON API")
+    parser.add_argument("--dir", default=".", help="folder holding the .txt save files")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = BudgetServer(args.dir, args.host, args.port)
+
+    async def run():
+        await server.start()
+        print(f"BudgetBuddy API listening on http://{server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Load test for the BudgetBuddy JSON API (library/server.py).
+
+Start a server first:   python -m library.server --dir . --port 8765
+Then run:               python load_test.py --clients 50 --requests 200
+
+Each client keeps one connection open and mixes expense writes, file reads,
+balance checks and streamed expense listings against one shared save file.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+async def request(reader, writer, method, path, data=None):
+    body = json.dumps(data).encode("utf-8") if data is not None else b""
+    head = (f"{method} {path} HTTP/1.1\r\n"
+            f"Host: localhost\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n")
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        key, _, value = line.decode("latin-1").partition(":")
+        headers[key.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding") == "chunked":
+        payload = b""
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            chunk = await reader.readexactly(size + 2)
+            if size == 0:
+                break
+            payload += chunk[:-2]
+    else:
+        payload = await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, payload
+
+
+async def client(host, port, name, num_requests, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(num_requests):
+            roll = random.random()
+            if roll < 0.4:
+                args = ("POST", f"/files/{name}/expenses",
+                        {"category": random.choice(["Grocery", "Car", "Rent"]),
+                         "name": f"item{random.randint(1, 50)}",
+                         "amount": round(random.uniform(1, 100), 2)})
+            elif roll < 0.7:
+                args = ("GET", f"/files/{name}")
+            elif roll < 0.9:
+                args = ("GET", f"/files/{name}/balance?income=5000")
+            else:
+                args = ("GET", f"/files/{name}/expenses")
+
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, *args)
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors.append(status)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run(args):
+    # Start every run from an empty file so results are comparable
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    await request(reader, writer, "PUT", f"/files/{args.file}", {"categories": []})
+    writer.close()
+    await writer.wait_closed()
+
+    latencies = []
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(args.host, args.port, args.file, args.requests, latencies, errors)
+                           for _ in range(args.clients)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"Clients: {args.clients}, requests: {total}, errors: {len(errors)}")
+    print(f"Elapsed: {elapsed:.2f}s, throughput: {total / elapsed:.0f} req/s")
+    print(f"Latency p50: {latencies[total // 2] * 1000:.1f} ms, "
+          f"p95: {latencies[int(total * 0.95)] * 1000:.1f} ms, "
+          f"max: {latencies[-1] * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the BudgetBuddy JSON API on localhost")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--file", default="loadtest", help="save file name to use")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import pytest
+
+from library import budgetdiff, savefile
+
+
+@pytest.fixture
+def write(tmp_path):
+    def write(name, text):
+        path = tmp_path / f"{name}.txt"
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+    return write
+
+
+def merged(budgets):
+    return {b.expense_type: list(zip(b.categories, b.expenses)) for b in budgets}
+
+
+BASE = "Grocery\nMilk : $10.00\nEggs : $5.00\n\nCar\nGas : $40.00\n"
+
+
+# -------------------------------------------------------------
+# DIFF
+# -------------------------------------------------------------
+def test_diff_reports_changes_and_totals(write):
+    old = write("old", BASE)
+    new = write("new", "Grocery\nMilk : $12.00\nEggs : $5.00\nBread : $3.00\n\nRent\nApt : $900.00\n")
+    report = budgetdiff.diff_files(old, new)
+
+    assert report["categories_added"] == ["Rent"]
+    assert report["categories_removed"] == ["Car"]
+    assert report["added"] == [("Grocery", "Bread", 3.0), ("Rent", "Apt", 900.0)]
+    assert report["removed"] == [("Car", "Gas", 40.0)]
+    assert report["changed"] == [("Grocery", "Milk", 10.0, 12.0)]
+    assert report["total_delta"] == pytest.approx(865.0)
+    assert "new_balance" not in report
+
+
+def test_diff_balance_only_with_income(write):
+    old = write("old", BASE)
+    report = budgetdiff.diff_files(old, old, income=100)
+    assert report["old_balance"] == report["new_balance"] == pytest.approx(45.0)
+    assert "Remaining Balance" in budgetdiff.format_diff(report)
+    assert "Remaining Balance" not in budgetdiff.format_diff(budgetdiff.diff_files(old, old))
+
+
+def test_diff_repeated_names_match_by_amount(write):
+    old = write("old", "A\nMilk : $5.00\nMilk : $7.00\n")
+    new = write("new", "A\nMilk : $7.00\n")
+    report = budgetdiff.diff_files(old, new)
+    assert report["removed"] == [("A", "Milk", 5.0)]
+    assert report["changed"] == []
+    assert report["added"] == []
+
+
+# -------------------------------------------------------------
+# MERGE
+# -------------------------------------------------------------
+def test_merge_takes_one_sided_edits(write):
+    base = write("base", BASE)
+    ours = write("ours", "Grocery\nMilk : $12.00\nEggs : $5.00\n\nCar\nGas : $40.00\n")
+    theirs = write("theirs", "Grocery\nMilk : $10.00\n\nCar\nGas : $40.00\nTires : $100.00\n")
+    budgets, conflicts = budgetdiff.merge_files(base, ours, theirs)
+
+    assert conflicts == []
+    assert merged(budgets) == {"Grocery": [("Milk", 12.0)],
+                               "Car": [("Gas", 40.0), ("Tires", 100.0)]}
+
+
+def test_merge_edit_edit_conflict_keeps_ours(write):
+    base = write("base", BASE)
+    ours = write("ours", BASE.replace("$10.00", "$12.00"))
+    theirs = write("theirs", BASE.replace("$10.00", "$11.00"))
+    budgets, conflicts = budgetdiff.merge_files(base, ours, theirs)
+
+    assert conflicts == [("Grocery", "Milk", 10.0, 12.0, 11.0)]
+    assert merged(budgets)["Grocery"] == [("Milk", 12.0), ("Eggs", 5.0)]
+
+
+def test_merge_edit_delete_conflict(write):
+    base = write("base", BASE)
+    ours = write("ours", BASE.replace("Gas : $40.00", "Gas : $45.00"))
+    theirs = write("theirs", BASE.replace("Gas : $40.00\n", ""))
+    budgets, conflicts = budgetdiff.merge_files(base, ours, theirs)
+
+    assert conflicts == [("Car", "Gas", 40.0, 45.0, None)]
+    assert merged(budgets)["Car"] == [("Gas", 45.0)]
+
+
+@pytest.mark.parametrize("ours_deleted", [False, True])
+def test_merge_category_delete_vs_expense_add(write, ours_deleted):
+    base = write("base", BASE)
+    added = write("added", BASE + "Tires : $100.00\n")
+    deleted = write("deleted", "Grocery\nMilk : $10.00\nEggs : $5.00\n")
+    ours, theirs = (deleted, added) if ours_deleted else (added, deleted)
+    budgets, conflicts = budgetdiff.merge_files(base, ours, theirs)
+
+    if ours_deleted:
+        assert conflicts == [("Car", None, True, None, True)]
+        assert "Car" not in merged(budgets)
+    else:
+        assert conflicts == [("Car", None, True, True, None)]
+        assert merged(budgets)["Car"] == [("Tires", 100.0)]
+
+
+def test_merge_repeated_names_different_deletes(write):
+    base = write("base", "A\nMilk : $5.00\nMilk : $7.00\n")
+    ours = write("ours", "A\nMilk : $7.00\n")
+    theirs = write("theirs", "A\nMilk : $5.00\n")
+    budgets, conflicts = budgetdiff.merge_files(base, ours, theirs)
+
+    assert conflicts == []
+    assert merged(budgets) == {"A": []}
+
+
+def test_merge_same_addition_on_both_sides_once(write, tmp_path):
+    base = write("base", BASE)
+    both = write("both", BASE + "Tires : $100.00\n")
+    out = str(tmp_path / "out.txt")
+    budgets, conflicts = budgetdiff.merge_files(base, both, both, out)
+
+    assert conflicts == []
+    assert merged(savefile.read_budgets(out))["Car"] == [("Gas", 40.0), ("Tires", 100.0)]
+
+
+def test_merge_cli_exit_codes(write, tmp_path, capsys):
+    base = write("base", BASE)
+    ours = write("ours", BASE.replace("$10.00", "$12.00"))
+    theirs = write("theirs", BASE.replace("$10.00", "$11.00"))
+    out = str(tmp_path / "out.txt")
+
+    assert budgetdiff.main(["merge", base, ours, base, "-o", out]) == 0
+    assert budgetdiff.main(["merge", base, ours, theirs, "-o", out]) == 1
+    assert budgetdiff.main(["diff", base, str(tmp_path / "missing.txt")]) == 2
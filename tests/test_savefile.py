@@ -0,0 +1,56 @@
+import pytest
+
+from library import savefile
+from library.classes import Budget
+
+
+def make_budget(category, *expenses):
+    budget = Budget(category)
+    for name, amount in expenses:
+        budget.categories.append(name)
+        budget.expenses.append(amount)
+    return budget
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "budget.txt")
+    budgets = [make_budget("Grocery", ("Milk", 10), ("Milk", 2.5), ("Eggs : $x", 3)),
+               make_budget("Empty"),
+               make_budget("Car", ("Gas", 40.126))]
+    savefile.write_budgets(path, budgets)
+
+    loaded = savefile.read_budgets(path)
+    assert [b.expense_type for b in loaded] == ["Grocery", "Empty", "Car"]
+    assert loaded[0].categories == ["Milk", "Milk", "Eggs : $x"]
+    assert loaded[0].expenses == [10.0, 2.5, 3.0]
+    assert loaded[1].expenses == []
+    assert loaded[2].expenses == [savefile.stored_amount(40.126)]
+
+
+def test_matches_summary_screen_format(tmp_path):
+    path = str(tmp_path / "budget.txt")
+    savefile.write_budgets(path, [make_budget("Grocery", ("Milk", 10))])
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "Grocery\nMilk : $10.00\n"
+
+
+@pytest.mark.parametrize("budget", [
+    make_budget(""),
+    make_budget("   "),
+    make_budget("Rent\nEvil"),
+    make_budget("Rent", ("x\r", 1)),
+    make_budget("Rent", ("x", float("nan"))),
+    make_budget("Rent", ("x", float("inf"))),
+])
+def test_rejects_what_cannot_be_read_back(tmp_path, budget):
+    path = tmp_path / "budget.txt"
+    with pytest.raises(ValueError):
+        savefile.write_budgets(str(path), [budget])
+    assert not path.exists()
+
+
+def test_bad_expense_line(tmp_path):
+    path = tmp_path / "budget.txt"
+    path.write_text("Grocery\nnot an expense\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        savefile.read_budgets(str(path))